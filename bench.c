@@ -0,0 +1,71 @@
+/*
+ * Kernel de benchmark en C nativo, cargado desde main.py con ctypes (--native)
+ *
+ * Versión de benchmark_math escrita a mano: los operandos se generan por bloques con un
+ * xorshift64 y el cálculo se hace en un bucle sin dependencias entre iteraciones, que el
+ * compilador puede vectorizar (sqrt/sin/log vectoriales de libmvec con -ffast-math).
+ * Con OpenMP cada hilo ejecuta el bucle de forma independiente, sin GIL de por medio.
+ *
+ * Compilación:
+ *   cc -O3 -march=native -ffast-math -fopenmp -shared -fPIC bench.c -o libbench.so -lmvec -lm
+ */
+
+#include <math.h>
+#include <stdint.h>
+#include <time.h>
+#include <omp.h>
+
+/* Operaciones por bloque entre chequeos de tiempo (3 arreglos de doubles caben en L1) */
+#define CHUNK 1024
+
+/* Destino exportado de los resultados para que el compilador no elimine el cálculo */
+double bench_sink = 0.0;
+
+static double now(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec * 1e-9;
+}
+
+static inline double xorshift_unit(uint64_t *s)
+{
+    *s ^= *s << 13;
+    *s ^= *s >> 7;
+    *s ^= *s << 17;
+    return (*s >> 11) * 0x1.0p-53; /* 53 bits aleatorios -> [0, 1) */
+}
+
+/*
+ * Ejecuta operaciones matemáticas intensivas durante 'duration' segundos en
+ * 'num_threads' hilos y retorna el total de operaciones realizadas.
+ */
+uint64_t bench_math(double duration, int num_threads)
+{
+    uint64_t ops = 0;
+    double sink = 0.0;
+    double t0 = now();
+
+    #pragma omp parallel num_threads(num_threads) reduction(+:ops, sink)
+    {
+        double a[CHUNK], b[CHUNK], c[CHUNK];
+        uint64_t s = ((uint64_t)(t0 * 1e9) ^ (0x9E3779B97F4A7C15ULL * (omp_get_thread_num() + 1))) | 1;
+
+        while (now() - t0 < duration) {
+            for (int i = 0; i < CHUNK; i++) {
+                a[i] = xorshift_unit(&s);
+                b[i] = xorshift_unit(&s);
+                c[i] = xorshift_unit(&s);
+            }
+            #pragma GCC ivdep
+            for (int i = 0; i < CHUNK; i++) {
+                double result = sqrt(a[i] * a[i] + b[i] * b[i]) + sin(c[i]) + log1p(a[i]);
+                sink += result > 0 ? result * sqrt(result) : 0.0;
+            }
+            ops += CHUNK;
+        }
+    }
+
+    bench_sink = sink;
+    return ops;
+}
@@ -0,0 +1,93 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Kernels de benchmark compilados con Cython
+
+Versiones de benchmark_math y benchmark_integer con variables tipadas en C y llamadas
+directas a libc (math, rand y clock_gettime), sin crear objetos de Python por operación.
+
+Compilación: python setup.py build_ext --inplace
+"""
+
+from libc.math cimport sqrt, sin, log1p
+from libc.stdlib cimport rand, RAND_MAX
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+
+# Destino de los resultados acumulados para que el compilador no elimine el cálculo
+cdef double math_sink = 0.0
+cdef unsigned long long integer_sink = 0
+
+def sinks():
+    """
+    Retorna los últimos resultados acumulados por los kernels. Como los sinks se leen
+    desde aquí, el compilador no puede descartar los cálculos que los alimentan.
+    """
+    return math_sink, integer_sink
+
+# Iteraciones entre chequeos de tiempo: evita una llamada a clock_gettime por operación
+cdef long CHUNK = 10000
+
+cdef inline double now() noexcept nogil:
+    """Equivalente en C de time.perf_counter()."""
+    cdef timespec ts
+    clock_gettime(CLOCK_MONOTONIC, &ts)
+    return ts.tv_sec + ts.tv_nsec * 1e-9
+
+cpdef (long, double) bench_math(double duration):
+    """
+    Ejecuta operaciones matemáticas intensivas durante 'duration' segundos.
+
+    Retorna:
+        - Total de operaciones realizadas.
+        - Duración exacta de la prueba.
+    """
+    global math_sink
+    cdef double a, b, c, result
+    cdef long i
+    cdef double acc = 0.0
+    cdef long ops = 0
+    cdef double start = now()
+    while now() - start < duration:
+        for i in range(CHUNK):
+            a = rand() / <double>RAND_MAX
+            b = rand() / <double>RAND_MAX
+            c = rand() / <double>RAND_MAX
+            result = sqrt(a * a + b * b) + sin(c) + log1p(a)
+            result = result * sqrt(result) if result > 0 else 0.0
+            acc += result
+        ops += CHUNK
+    math_sink = acc
+    return ops, now() - start
+
+cpdef (long, double) bench_integer(double duration):
+    """
+    Ejecuta operaciones aritméticas con enteros de 64 bits durante 'duration' segundos.
+
+    Los operandos se generan con un xorshift64 en línea, mucho más barato que rand().
+
+    Retorna:
+        - Total de operaciones realizadas.
+        - Duración exacta de la prueba.
+    """
+    global integer_sink
+    cdef long long a, b, c, result
+    cdef long i
+    # Sin signo: al desbordarse la suma da la vuelta (módulo 2**64) en lugar de ser comportamiento indefinido
+    cdef unsigned long long acc = 0
+    cdef long ops = 0
+    cdef double start = now()
+    # Semilla distinta en cada llamada; xorshift requiere un estado distinto de cero
+    cdef unsigned long long s = <unsigned long long>(start * 1e9) | 1
+    while now() - start < duration:
+        for i in range(CHUNK):
+            s ^= s << 13; s ^= s >> 7; s ^= s << 17
+            a = <long long>(s % 1000) + 1
+            s ^= s << 13; s ^= s >> 7; s ^= s << 17
+            b = <long long>(s % 1000) + 1
+            s ^= s << 13; s ^= s >> 7; s ^= s << 17
+            c = <long long>(s % 1000) + 1
+            result = (a * b) + (a * c) - (b * c)
+            result *= (a + b + c)
+            acc += <unsigned long long>result
+        ops += CHUNK
+    integer_sink = acc
+    return ops, now() - start
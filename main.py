@@ -11,15 +11,74 @@ import time
 import random
 import math
 import threading
-import multiprocessing
-import statistics
 import argparse
 import logging
-from typing import Callable, Tuple, List
+import sys
+import os
+import ctypes
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Optional, Tuple, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa el generador de la librería estándar
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba es opcional: solo se usa con --numba
+    njit = None
+
+try:
+    import bench_cython
+except ImportError:  # Extensión opcional: se compila con "python setup.py build_ext --inplace"
+    bench_cython = None
+
+# Biblioteca opcional en C (bench.c), cargada con ctypes; ver el comentario de compilación en bench.c
+NATIVE_LIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "libbench.so")
+try:
+    native_lib = ctypes.CDLL(NATIVE_LIB_PATH)
+    native_lib.bench_math.restype = ctypes.c_uint64
+    native_lib.bench_math.argtypes = [ctypes.c_double, ctypes.c_int]
+except OSError:
+    native_lib = None
 
 # Configuración del logging para mostrar información en la consola
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
+# Iteraciones de los benchmarks en Python puro entre chequeos de tiempo; en benchmark_math
+# también es la cantidad de ternas aleatorias que se generan de una sola vez
+CHUNK = 10_000
+# Tamaño de lote de la versión vectorizada (lo bastante chico para mantenerse en caché L1/L2)
+VECTOR_BATCH = 4096
+# Iteraciones que ejecuta cada llamada a un kernel compilado con Numba entre chequeos de tiempo
+# (time.perf_counter no está disponible dentro de código nopython). Los kernels liberan el GIL
+# (nogil=True), por lo que también escalan en hilos de un intérprete con GIL.
+NUMBA_CHUNK = 100_000
+
+def new_rng():
+    """
+    Crea un generador de números aleatorios propio para un benchmark.
+
+    Con NumPy se usa un Generator PCG64, que produce lotes de doubles mucho más rápido que
+    el Mersenne Twister; sin NumPy, una instancia dedicada de random.Random.
+    """
+    if np is not None:
+        return np.random.Generator(np.random.PCG64())
+    return random.Random()
+
+def random_batch(size: int, rng) -> Iterable[Tuple[float, float, float]]:
+    """
+    Genera 'size' ternas de números aleatorios en [0, 1) con el generador 'rng' (ver new_rng).
+
+    Con NumPy las ternas se generan de forma vectorizada como tres listas de floats de
+    Python combinadas con zip, evitando tres llamadas a random() por iteración del benchmark.
+    """
+    if np is not None:
+        return zip(*rng.random((3, size)).tolist())
+    _rand = rng.random
+    return [(_rand(), _rand(), _rand()) for _ in range(size)]
+
 def benchmark_math(duration: int = 10) -> Tuple[int, float]:
     """
     Ejecuta operaciones matemáticas intensivas durante 'duration' segundos.
@@ -28,18 +87,44 @@ def benchmark_math(duration: int = 10) -> Tuple[int, float]:
         - Total de operaciones realizadas.
         - Duración exacta de la prueba.
     """
+    # Referencias locales: LOAD_FAST en lugar de buscar en el módulo en cada iteración
+    _sqrt = math.sqrt
+    _sin = math.sin
+    _log1p = math.log1p
+    rng = new_rng()
+    _pc = time.perf_counter
+    start = _pc()
+    operations = 0
+    # El reloj se consulta una vez por bloque de CHUNK operaciones y no en cada una
+    while _pc() - start < duration:
+        for a, b, c in random_batch(CHUNK, rng):
+            # a, b, c están en [0, 1): sqrt y log1p siempre están definidos
+            result = _sqrt(a**2 + b**2) + _sin(c) + _log1p(a)
+            result = result * _sqrt(result) if result > 0 else 0.0
+        operations += CHUNK
+    elapsed = _pc() - start
+    return operations, elapsed
+
+def benchmark_math_vectorized(duration: int = 10) -> Tuple[int, float]:
+    """
+    Versión vectorizada de benchmark_math utilizando ufuncs de NumPy.
+
+    Cada iteración procesa un lote de VECTOR_BATCH operaciones, por lo que mide el
+    rendimiento de NumPy y no el del intérprete. Requiere NumPy.
+
+    Retorna:
+        - Total de operaciones realizadas.
+        - Duración exacta de la prueba.
+    """
+    rng = np.random.default_rng()
     start = time.perf_counter()
     operations = 0
     while time.perf_counter() - start < duration:
-        a = random.random()
-        b = random.random()
-        c = random.random()
-        try:
-            result = math.sqrt(a**2 + b**2) + math.sin(c) + math.log(a + 1)
-        except ValueError:
-            result = 0
-        result = math.pow(result, 1.5) if result > 0 else 0
-        operations += 1
+        a, b, c = rng.random((3, VECTOR_BATCH))
+        result = np.sqrt(a**2 + b**2) + np.sin(c) + np.log1p(a)
+        # Todos los términos son >= 0, así que result**1.5 == result * sqrt(result) sin casos especiales
+        result *= np.sqrt(result)
+        operations += VECTOR_BATCH
     elapsed = time.perf_counter() - start
     return operations, elapsed
 
@@ -47,6 +132,71 @@ def benchmark_integer(duration: int = 10) -> Tuple[int, float]:
     """
     Ejecuta operaciones aritméticas con enteros durante 'duration' segundos.
     
+    Retorna:
+        - Total de operaciones realizadas.
+        - Duración exacta de la prueba.
+    """
+    _randint = random.Random().randint
+    _pc = time.perf_counter
+    start = _pc()
+    operations = 0
+    while _pc() - start < duration:
+        for _ in range(CHUNK):
+            a = _randint(1, 1000)
+            b = _randint(1, 1000)
+            c = _randint(1, 1000)
+            result = (a * b) + (a * c) - (b * c)
+            result *= (a + b + c)
+        operations += CHUNK
+    elapsed = _pc() - start
+    return operations, elapsed
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def numba_math_kernel(iterations: int) -> float:
+        """
+        Kernel compilado de benchmark_math. Acumula los resultados para que el
+        compilador no elimine el cálculo.
+        """
+        acc = 0.0
+        for _ in range(iterations):
+            a = np.random.random()
+            b = np.random.random()
+            c = np.random.random()
+            result = math.sqrt(a**2 + b**2) + math.sin(c) + math.log1p(a)
+            result = result * math.sqrt(result) if result > 0 else 0.0
+            acc += result
+        return acc
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def numba_integer_kernel(iterations: int) -> int:
+        """
+        Kernel compilado de benchmark_integer. Acumula los resultados para que el
+        compilador no elimine el cálculo.
+        """
+        acc = 0
+        for _ in range(iterations):
+            a = np.random.randint(1, 1001)
+            b = np.random.randint(1, 1001)
+            c = np.random.randint(1, 1001)
+            result = (a * b) + (a * c) - (b * c)
+            result *= (a + b + c)
+            acc += result
+        return acc
+
+def warmup_numba() -> None:
+    """
+    Compila (o carga desde la caché en __pycache__) los kernels de Numba para que
+    el tiempo de compilación no se cargue a la primera serie de pruebas.
+    """
+    numba_math_kernel(1)
+    numba_integer_kernel(1)
+
+def benchmark_math_numba(duration: int = 10) -> Tuple[int, float]:
+    """
+    Ejecuta benchmark_math compilado con Numba durante 'duration' segundos.
+    Requiere Numba.
+
     Retorna:
         - Total de operaciones realizadas.
         - Duración exacta de la prueba.
@@ -54,15 +204,64 @@ def benchmark_integer(duration: int = 10) -> Tuple[int, float]:
     start = time.perf_counter()
     operations = 0
     while time.perf_counter() - start < duration:
-        a = random.randint(1, 1000)
-        b = random.randint(1, 1000)
-        c = random.randint(1, 1000)
-        result = (a * b) + (a * c) - (b * c)
-        result *= (a + b + c)
-        operations += 1
+        numba_math_kernel(NUMBA_CHUNK)
+        operations += NUMBA_CHUNK
     elapsed = time.perf_counter() - start
     return operations, elapsed
 
+def benchmark_integer_numba(duration: int = 10) -> Tuple[int, float]:
+    """
+    Ejecuta benchmark_integer compilado con Numba durante 'duration' segundos.
+    Requiere Numba.
+
+    Retorna:
+        - Total de operaciones realizadas.
+        - Duración exacta de la prueba.
+    """
+    start = time.perf_counter()
+    operations = 0
+    while time.perf_counter() - start < duration:
+        numba_integer_kernel(NUMBA_CHUNK)
+        operations += NUMBA_CHUNK
+    elapsed = time.perf_counter() - start
+    return operations, elapsed
+
+def benchmark_math_native(duration: int = 10) -> Tuple[int, float]:
+    """
+    Ejecuta benchmark_math implementado en C nativo (libbench.so) durante 'duration' segundos.
+
+    Retorna:
+        - Total de operaciones realizadas.
+        - Duración exacta de la prueba.
+    """
+    start = time.perf_counter()
+    operations = native_lib.bench_math(duration, 1)
+    elapsed = time.perf_counter() - start
+    return operations, elapsed
+
+def openmp_benchmark(duration: int = 10, num_threads: int = 4) -> Tuple[int, float, int]:
+    """
+    Ejecuta benchmark_math implementado en C nativo en 'num_threads' hilos de OpenMP.
+    Los hilos corren dentro de la biblioteca, sin el GIL.
+
+    Retorna:
+        - Total de operaciones acumuladas de todos los hilos.
+        - Duración total de la prueba.
+        - Número de hilos utilizados.
+    """
+    start = time.perf_counter()
+    total_ops = native_lib.bench_math(duration, num_threads)
+    elapsed = time.perf_counter() - start
+    return total_ops, elapsed, num_threads
+
+def gil_enabled() -> bool:
+    """
+    Indica si el intérprete actual ejecuta con el GIL activo.
+    Solo los builds free-threaded de Python 3.13+ (PEP 703) pueden desactivarlo.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
 def worker_benchmark(duration: int, results: List[int], calc_function: Callable[[int], Tuple[int, float]]) -> None:
     """
     Función worker para ser ejecutada en un hilo.
@@ -94,40 +293,84 @@ def threaded_benchmark(duration: int = 10, num_threads: int = 4,
     elapsed = time.perf_counter() - start
     return total_ops, elapsed, num_threads
 
-def process_worker(duration: int, queue: multiprocessing.Queue,
-                   calc_function: Callable[[int], Tuple[int, float]]) -> None:
+def pinning_order() -> Tuple[List[int], int]:
     """
-    Función worker para ser ejecutada en un proceso.
-    Ejecuta la función de benchmark y coloca el resultado en una cola.
+    Retorna las CPUs lógicas disponibles para este proceso en el orden en que conviene
+    fijar procesos: primero una por cada núcleo físico y después los hermanos SMT
+    (hyperthreads) restantes, para que dos procesos compartan núcleo físico solo cuando
+    no queda otra opción. También retorna la cantidad de núcleos físicos.
+
+    Los hermanos SMT se identifican con la topología que expone Linux en /sys; si no
+    está disponible, cada CPU lógica se trata como un núcleo propio.
     """
-    ops, _ = calc_function(duration)
-    queue.put(ops)
+    first: List[int] = []
+    siblings_left: List[int] = []
+    seen = set()
+    for cpu in sorted(os.sched_getaffinity(0)):
+        try:
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list") as f:
+                siblings = f.read().strip()
+        except OSError:
+            siblings = str(cpu)
+        if siblings in seen:
+            siblings_left.append(cpu)
+        else:
+            seen.add(siblings)
+            first.append(cpu)
+    return first + siblings_left, len(first)
+
+def pinned_benchmark(calc_function: Callable[[int], Tuple[int, float]], duration: int,
+                     core_id: int) -> Tuple[int, float]:
+    """
+    Fija el proceso actual a la CPU 'core_id' y ejecuta la función de benchmark.
+    """
+    os.sched_setaffinity(0, {core_id})
+    return calc_function(duration)
 
-def multiprocess_benchmark(duration: int = 10, num_processes: int = 4,
-                           calc_function: Callable[[int], Tuple[int, float]] = benchmark_math) -> Tuple[int, float, int]:
+def multiprocess_benchmark(duration: int, pool: ProcessPoolExecutor, num_processes: int = 4,
+                           calc_function: Callable[[int], Tuple[int, float]] = benchmark_math,
+                           cores: Optional[List[int]] = None) -> Tuple[int, float, int]:
     """
     Ejecuta la función de benchmark en múltiples procesos.
+
+    Los procesos pertenecen a 'pool', que se crea una sola vez y se reutiliza en todas
+    las series para no cargar el arranque de los procesos al tiempo medido. Si se indica
+    'cores' (ver pinning_order), cada tarea se fija a una CPU distinta tomada en orden de
+    la lista, que debe tener al menos 'num_processes' CPUs.
     
     Retorna:
         - Total de operaciones acumuladas de todos los procesos.
         - Duración total de la prueba.
         - Número de procesos utilizados.
     """
-    processes: List[multiprocessing.Process] = []
-    queue = multiprocessing.Queue()
     start = time.perf_counter()
-    for _ in range(num_processes):
-        p = multiprocessing.Process(target=process_worker, args=(duration, queue, calc_function))
-        processes.append(p)
-        p.start()
-    for p in processes:
-        p.join()
-    total_ops = 0
-    while not queue.empty():
-        total_ops += queue.get()
+    if cores:
+        results = pool.map(pinned_benchmark, [calc_function] * num_processes, [duration] * num_processes,
+                           cores[:num_processes])
+    else:
+        results = pool.map(calc_function, [duration] * num_processes)
+    total_ops = sum(ops for ops, _ in results)
     elapsed = time.perf_counter() - start
     return total_ops, elapsed, num_processes
 
+def mean(values: List[float]) -> float:
+    """
+    Calcula el promedio de 'values'.
+    """
+    return sum(values) / len(values)
+
+def mean_stdev(values: List[float]) -> Tuple[float, float]:
+    """
+    Calcula el promedio y la desviación estándar muestral de 'values'.
+
+    Reemplaza a statistics.mean/stdev, cuya aritmética exacta es innecesaria para unas
+    pocas muestras en float64.
+    """
+    n = len(values)
+    avg = mean(values)
+    var = sum((x - avg) * (x - avg) for x in values) / (n - 1) if n > 1 else 0.0
+    return avg, math.sqrt(var)
+
 def run_series(test_function: Callable, test_name: str, series: int = 3, duration: int = 10, **kwargs) -> List[float]:
     """
     Ejecuta múltiples series de pruebas utilizando la función de benchmark especificada.
@@ -153,8 +396,7 @@ def run_series(test_function: Callable, test_name: str, series: int = 3, duratio
         ops_per_sec = ops / dur if dur > 0 else 0
         results.append(ops_per_sec)
         logging.info(f"  Prueba {i+1}: {ops} operaciones en {dur:.2f} seg -> {ops_per_sec:.2f} ops/seg {extra_info}")
-    avg = statistics.mean(results)
-    stdev = statistics.stdev(results) if len(results) > 1 else 0.0
+    avg, stdev = mean_stdev(results)
     logging.info(f"  Promedio: {avg:.2f} ops/seg, Desviación estándar: {stdev:.2f} ops/seg")
     return results
 
@@ -164,32 +406,112 @@ def main():
     parser.add_argument("--series", type=int, default=3, help="Número de series a ejecutar para cada test")
     parser.add_argument("--threads", type=int, default=4, help="Número de hilos para pruebas multihilo")
     parser.add_argument("--processes", type=int, default=4, help="Número de procesos para pruebas multiproceso")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="Ejecuta además la prueba matemática vectorizada con NumPy")
+    parser.add_argument("--numba", action="store_true",
+                        help="Ejecuta además las pruebas compiladas con Numba")
+    parser.add_argument("--cython", action="store_true",
+                        help="Ejecuta además las pruebas compiladas con Cython (ver setup.py)")
+    parser.add_argument("--native", action="store_true",
+                        help="Ejecuta además las pruebas en C nativo (libbench.so, ver bench.c)")
+    parser.add_argument("--no-pin", action="store_true",
+                        help="No fija cada proceso de la prueba multiproceso a un núcleo físico distinto")
     args = parser.parse_args()
+    if args.vectorized and np is None:
+        parser.error("--vectorized requiere NumPy instalado")
+    if args.numba and njit is None:
+        parser.error("--numba requiere Numba instalado")
+    if args.cython and bench_cython is None:
+        parser.error("--cython requiere compilar la extensión: python setup.py build_ext --inplace")
+    if args.native and native_lib is None:
+        parser.error(f"--native requiere compilar {NATIVE_LIB_PATH} (ver bench.c)")
 
     logging.info("=== Benchmark de Procesamiento en Python ===")
     
     # Pruebas single-thread
     math_results = run_series(benchmark_math, "Operaciones matemáticas (single-thread)", args.series, args.duration)
     int_results = run_series(benchmark_integer, "Aritmética entera (single-thread)", args.series, args.duration)
+    if args.vectorized:
+        vectorized_results = run_series(benchmark_math_vectorized, "Operaciones matemáticas vectorizadas (NumPy)",
+                                        args.series, args.duration)
+    if args.numba:
+        warmup_numba()
+        numba_math_results = run_series(benchmark_math_numba, "Operaciones matemáticas (Numba)",
+                                        args.series, args.duration)
+        numba_int_results = run_series(benchmark_integer_numba, "Aritmética entera (Numba)",
+                                       args.series, args.duration)
+    if args.cython:
+        cython_math_results = run_series(bench_cython.bench_math, "Operaciones matemáticas (Cython)",
+                                         args.series, args.duration)
+        cython_int_results = run_series(bench_cython.bench_integer, "Aritmética entera (Cython)",
+                                        args.series, args.duration)
+    if args.native:
+        native_results = run_series(benchmark_math_native, "Operaciones matemáticas (C nativo)",
+                                    args.series, args.duration)
+        openmp_results = run_series(openmp_benchmark,
+                                    f"Operaciones matemáticas en {args.threads} hilos OpenMP (C nativo)",
+                                    args.series, args.duration, num_threads=args.threads)
     
-    # Prueba multihilo (para cargas que puedan beneficiarse de la concurrencia, aunque el GIL limita en CPU-bound)
-    threaded_results = run_series(threaded_benchmark,
-                                  f"Operaciones matemáticas en {args.threads} hilos",
-                                  args.series, args.duration,
-                                  num_threads=args.threads, calc_function=benchmark_math)
+    # Prueba multihilo: con el GIL activo los hilos se serializan en cargas CPU-bound,
+    # así que solo se ejecuta en builds free-threaded donde el resultado es significativo
+    threaded_results: List[float] = []
+    if gil_enabled():
+        logging.warning("\nGIL activo: se omite la prueba multihilo (los hilos no escalan en cargas CPU-bound)")
+    else:
+        logging.info("\nBuild free-threaded detectado (GIL desactivado): se ejecuta la prueba multihilo")
+        threaded_results = run_series(threaded_benchmark,
+                                      f"Operaciones matemáticas en {args.threads} hilos",
+                                      args.series, args.duration,
+                                      num_threads=args.threads, calc_function=benchmark_math)
+    # Los kernels de Numba liberan el GIL, así que esta prueba es significativa en cualquier build
+    if args.numba:
+        numba_threaded_results = run_series(threaded_benchmark,
+                                            f"Operaciones matemáticas en {args.threads} hilos (Numba)",
+                                            args.series, args.duration,
+                                            num_threads=args.threads, calc_function=benchmark_math_numba)
     
     # Prueba multiproceso (para aprovechar todos los núcleos en tareas CPU-bound)
-    multiprocess_results = run_series(multiprocess_benchmark,
-                                      f"Operaciones matemáticas en {args.processes} procesos",
-                                      args.series, args.duration,
-                                      num_processes=args.processes, calc_function=benchmark_math)
+    # sched_setaffinity solo existe en Linux; en otros sistemas el planificador reparte los procesos
+    cores = None
+    if not args.no_pin and hasattr(os, "sched_setaffinity"):
+        cores, physical = pinning_order()
+        if args.processes > len(cores):
+            logging.warning(f"\nHay {len(cores)} CPUs lógicas para {args.processes} procesos: "
+                            "no se fijan los procesos a núcleos")
+            cores = None
+        elif args.processes > physical:
+            logging.warning(f"\nHay {physical} núcleos físicos para {args.processes} procesos: "
+                            "algunos procesos compartirán núcleo físico (SMT)")
+    with ProcessPoolExecutor(max_workers=args.processes) as pool:
+        # El pool arranca sus procesos con el primer submit: se lo calienta con tareas vacías
+        # para que el arranque (y las importaciones con spawn/forkserver) no cuente en la primera serie
+        list(pool.map(abs, range(args.processes)))
+        multiprocess_results = run_series(multiprocess_benchmark,
+                                          f"Operaciones matemáticas en {args.processes} procesos",
+                                          args.series, args.duration, pool=pool,
+                                          num_processes=args.processes, calc_function=benchmark_math,
+                                          cores=cores)
     
     # Resumen general
     logging.info("\n=== Resumen General ===")
-    logging.info("Operaciones matemáticas (single-thread): Promedio: {:.2f} ops/seg".format(statistics.mean(math_results)))
-    logging.info("Aritmética entera (single-thread): Promedio: {:.2f} ops/seg".format(statistics.mean(int_results)))
-    logging.info("Operaciones matemáticas (multihilo, {} hilos): Promedio: {:.2f} ops/seg".format(args.threads, statistics.mean(threaded_results)))
-    logging.info("Operaciones matemáticas (multiproceso, {} procesos): Promedio: {:.2f} ops/seg".format(args.processes, statistics.mean(multiprocess_results)))
+    logging.info("Operaciones matemáticas (single-thread): Promedio: {:.2f} ops/seg".format(mean(math_results)))
+    logging.info("Aritmética entera (single-thread): Promedio: {:.2f} ops/seg".format(mean(int_results)))
+    if args.vectorized:
+        logging.info("Operaciones matemáticas vectorizadas (NumPy): Promedio: {:.2f} ops/seg".format(mean(vectorized_results)))
+    if args.numba:
+        logging.info("Operaciones matemáticas (Numba): Promedio: {:.2f} ops/seg".format(mean(numba_math_results)))
+        logging.info("Aritmética entera (Numba): Promedio: {:.2f} ops/seg".format(mean(numba_int_results)))
+    if args.cython:
+        logging.info("Operaciones matemáticas (Cython): Promedio: {:.2f} ops/seg".format(mean(cython_math_results)))
+        logging.info("Aritmética entera (Cython): Promedio: {:.2f} ops/seg".format(mean(cython_int_results)))
+    if args.native:
+        logging.info("Operaciones matemáticas (C nativo): Promedio: {:.2f} ops/seg".format(mean(native_results)))
+        logging.info("Operaciones matemáticas (C nativo, {} hilos OpenMP): Promedio: {:.2f} ops/seg".format(args.threads, mean(openmp_results)))
+    if threaded_results:
+        logging.info("Operaciones matemáticas (multihilo, {} hilos): Promedio: {:.2f} ops/seg".format(args.threads, mean(threaded_results)))
+    if args.numba:
+        logging.info("Operaciones matemáticas (multihilo Numba, {} hilos): Promedio: {:.2f} ops/seg".format(args.threads, mean(numba_threaded_results)))
+    logging.info("Operaciones matemáticas (multiproceso, {} procesos): Promedio: {:.2f} ops/seg".format(args.processes, mean(multiprocess_results)))
 
 if __name__ == '__main__':
     main()
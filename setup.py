@@ -0,0 +1,18 @@
+"""
+Compila los kernels opcionales de Cython utilizados por main.py (--cython).
+
+Uso: python setup.py build_ext --inplace
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+extensions = [
+    Extension("bench_cython", ["bench_cython.pyx"],
+              extra_compile_args=["-O3", "-ffast-math", "-march=native"]),
+]
+
+setup(
+    name="measure-kernels",
+    ext_modules=cythonize(extensions),
+)